@@ -9,56 +9,91 @@ Usage:
 """
 
 import csv
+import io
 import json
+import operator
 import sys
 import urllib.request
+from collections.abc import Iterable
 from pathlib import Path
 
 STATIONS_CSV_URL = (
     "https://raw.githubusercontent.com/iRail/stations/master/stations.csv"
 )
+# Output field -> stations.csv column
+CSV_COLUMNS = {
+    "uri": "URI",
+    "name": "name",
+    "alternative_fr": "alternative-fr",
+    "alternative_nl": "alternative-nl",
+    "alternative_de": "alternative-de",
+    "alternative_en": "alternative-en",
+    "longitude": "longitude",
+    "latitude": "latitude",
+    "country_code": "country-code",
+}
 OUTPUT_PATH = Path(__file__).resolve().parent.parent / "src" / "irail_mcp" / "data" / "stations.json"
 
 
-def fetch_csv(url: str) -> str:
-    """Download the stations CSV."""
+def fetch_stations(url: str) -> list[dict]:
+    """Download the stations CSV and parse it while streaming."""
     req = urllib.request.Request(url, headers={"User-Agent": "irail-mcp/update-stations"})
     with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.read().decode("utf-8")
+        return parse_stations(io.TextIOWrapper(resp, encoding="utf-8", newline=""))
 
 
-def parse_stations(csv_text: str) -> list[dict]:
-    """Parse CSV into a list of station dicts with only the fields we need."""
-    reader = csv.DictReader(csv_text.splitlines())
+def parse_stations(lines: Iterable[str]) -> list[dict]:
+    """Parse CSV lines into a list of station dicts with only the fields we need.
+
+    Raises:
+        ValueError: If a required column is missing from the header.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, [])
+    missing = [column for column in CSV_COLUMNS.values() if column not in header]
+    if missing:
+        raise ValueError(f"stations.csv is missing columns: {', '.join(missing)}")
+
+    fields = tuple(CSV_COLUMNS)
+    get_fields = operator.itemgetter(*(header.index(c) for c in CSV_COLUMNS.values()))
+    name_idx = header.index(CSV_COLUMNS["name"])
+    width = len(header)
+
     stations = []
     for row in reader:
-        station = {
-            "uri": row.get("URI", ""),
-            "name": row.get("name", ""),
-            "alternative_fr": row.get("alternative-fr", ""),
-            "alternative_nl": row.get("alternative-nl", ""),
-            "alternative_de": row.get("alternative-de", ""),
-            "alternative_en": row.get("alternative-en", ""),
-            "longitude": row.get("longitude", ""),
-            "latitude": row.get("latitude", ""),
-            "country_code": row.get("country-code", ""),
-        }
+        if len(row) < width:
+            row += [""] * (width - len(row))
         # Only include stations with a name
-        if station["name"]:
-            stations.append(station)
+        if row[name_idx]:
+            stations.append(dict(zip(fields, get_fields(row))))
     return stations
 
 
+def dump_stations(stations: list[dict]) -> str:
+    """Serialize stations as a JSON array with one compact station per line.
+
+    Compact separators keep the file small (it is parsed when
+    irail_mcp.station_search is imported); one station per line keeps
+    refresh PR diffs reviewable.
+    """
+    lines = (
+        json.dumps(station, ensure_ascii=False, separators=(",", ":"))
+        for station in stations
+    )
+    return "[\n" + ",\n".join(lines) + "\n]\n"
+
+
 def main() -> None:
     print(f"Fetching stations from {STATIONS_CSV_URL} ...")
-    csv_text = fetch_csv(STATIONS_CSV_URL)
-
-    stations = parse_stations(csv_text)
+    try:
+        stations = fetch_stations(STATIONS_CSV_URL)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
     print(f"Parsed {len(stations)} stations")
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(stations, f, ensure_ascii=False, indent=2)
+        f.write(dump_stations(stations))
 
     size_kb = OUTPUT_PATH.stat().st_size / 1024
     print(f"Wrote {OUTPUT_PATH} ({size_kb:.1f} KB)")
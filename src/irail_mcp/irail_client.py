@@ -1,47 +1,88 @@
 """iRail API client for fetching Belgian railway data."""
 
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 
 BASE_URL = "https://api.irail.be/v1"
 USER_AGENT = "irail-mcp/0.1.0 (github.com/anthropics/irail-mcp)"
 RATE_LIMIT = 3  # requests per second
 RATE_LIMIT_DELAY = 1.0 / RATE_LIMIT  # delay between requests
+CACHE_TTL = 60.0  # seconds to reuse disturbance/vehicle responses
+CACHE_MAXSIZE = 128
+
+# User-facing messages for HTTP errors from the iRail API
+_STATUS_MESSAGES = {
+    429: "Rate limit exceeded. iRail API allows 3 requests/second.",
+    404: "Station or resource not found.",
+}
+_SERVER_ERROR_MESSAGE = "iRail API server error ({code}). Please try again later."
+
+
+def _format_datetime(dt: datetime) -> tuple[str, str]:
+    """Format a datetime as iRail's (ddmmyy, hhmm) query parameters."""
+    return (
+        f"{dt.day:02d}{dt.month:02d}{dt.year % 100:02d}",
+        f"{dt.hour:02d}{dt.minute:02d}",
+    )
 
 
 class RateLimiter:
-    """Simple rate limiter to respect iRail API limits."""
+    """Token-bucket rate limiter to respect iRail API limits.
+
+    Allows bursts of up to ``capacity`` requests while capping the long-run
+    average at ``requests_per_second``.
+    """
 
-    def __init__(self, requests_per_second: float):
+    def __init__(self, requests_per_second: float, capacity: float | None = None):
+        self.rate = requests_per_second
         self.delay = 1.0 / requests_per_second
-        self.last_request = 0.0
+        self.capacity = capacity if capacity is not None else requests_per_second
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
 
     async def wait(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        import time
-
-        now = time.time()
-        elapsed = now - self.last_request
-        if elapsed < self.delay:
-            await asyncio.sleep(self.delay - elapsed)
-        self.last_request = time.time()
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.last_refill = time.monotonic()
+            self.tokens -= 1
 
 
 class iRailClient:
     """Client for interacting with the iRail API."""
 
+    # Query parameters sent with every request; every get_* method passes lang
+    _default_params = {"format": "json"}
+
     def __init__(self):
         self.client: httpx.AsyncClient | None = None
         self.rate_limiter = RateLimiter(RATE_LIMIT)
+        self._cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
             headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0,
+            ),
+            http2=True,
         )
         return self
 
@@ -58,29 +99,43 @@ class iRailClient:
         await self.rate_limiter.wait()
 
         url = f"{BASE_URL}{path}"
-        params = kwargs.pop("params", {})
-        params.setdefault("format", "json")
-        params.setdefault("lang", "en")
+        params = {**self._default_params, **kwargs.pop("params", {})}
 
         try:
             response = await self.client.request(
                 method, url, params=params, **kwargs
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                raise ValueError(
-                    "Rate limit exceeded. iRail API allows 3 requests/second."
-                )
-            elif e.response.status_code == 404:
-                raise ValueError("Station or resource not found.")
-            elif e.response.status_code >= 500:
-                raise ValueError(
-                    f"iRail API server error ({e.response.status_code}). Please try again later."
-                )
+            code = e.response.status_code
+            message = _STATUS_MESSAGES.get(code)
+            if message is None and code >= 500:
+                message = _SERVER_ERROR_MESSAGE.format(code=code)
+            if message:
+                raise ValueError(message) from e
             raise
 
+    async def _cached_request(
+        self, key: tuple, path: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """GET a path, reusing a response younger than CACHE_TTL for the same key.
+
+        Cache hits skip the rate limiter entirely.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        result = await self._request("GET", path, params=params)
+
+        self._cache.pop(key, None)
+        if len(self._cache) >= CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + CACHE_TTL, result)
+        return result
+
     async def get_liveboard(
         self,
         station: str,
@@ -102,9 +157,7 @@ class iRailClient:
         if datetime_obj is None:
             datetime_obj = datetime.now()
 
-        # Format: ddmmyy and hhmm
-        date_str = datetime_obj.strftime("%d%m%y")
-        time_str = datetime_obj.strftime("%H%M")
+        date_str, time_str = _format_datetime(datetime_obj)
 
         params = {
             "station": station,
@@ -139,8 +192,7 @@ class iRailClient:
         if datetime_obj is None:
             datetime_obj = datetime.now()
 
-        date_str = datetime_obj.strftime("%d%m%y")
-        time_str = datetime_obj.strftime("%H%M")
+        date_str, time_str = _format_datetime(datetime_obj)
 
         params = {
             "from": from_station,
@@ -172,7 +224,7 @@ class iRailClient:
         if datetime_obj is None:
             datetime_obj = datetime.now()
 
-        date_str = datetime_obj.strftime("%d%m%y")
+        date_str, _ = _format_datetime(datetime_obj)
 
         params = {
             "id": vehicle_id,
@@ -180,7 +232,9 @@ class iRailClient:
             "lang": lang,
         }
 
-        return await self._request("GET", "/vehicle/", params=params)
+        return await self._cached_request(
+            ("vehicle", vehicle_id, date_str, lang), "/vehicle/", params
+        )
 
     async def get_disturbances(self, lang: str = "en") -> dict[str, Any]:
         """Get current network disturbances and planned works.
@@ -191,4 +245,6 @@ class iRailClient:
         Returns:
             Dictionary with disturbances and planned works.
         """
-        return await self._request("GET", "/disturbances/", params={"lang": lang})
+        return await self._cached_request(
+            ("disturbances", lang), "/disturbances/", {"lang": lang}
+        )
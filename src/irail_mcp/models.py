@@ -1,4 +1,8 @@
-"""Data models for iRail API responses."""
+"""Data models for iRail API responses.
+
+The server formats raw API dicts directly and does not import this module,
+so no validation runs on the tool-call path.
+"""
 
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -1,10 +1,14 @@
 """iRail MCP Server for Belgian railway data."""
 
+import asyncio
 import json
 import logging
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
+import httpx
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
@@ -16,6 +20,22 @@ logger = logging.getLogger(__name__)
 # Create MCP server
 app = Server("irail-mcp")
 
+# Shared API client, opened once in main() so HTTP connections are reused
+# across tool calls.
+_client: iRailClient | None = None
+
+# Upper bound on stations per get_multi_liveboard call; each costs a
+# rate-limit token.
+MAX_MULTI_STATIONS = 10
+
+
+# Fast paths for common inputs; used with fullmatch so trailing newlines and
+# non-ASCII digits fall through to strptime exactly as before.
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+_EU_DATE = re.compile(r"(\d{1,2})([/.])(\d{1,2})\2(\d{4})", re.ASCII)
+_PLUS_DAYS = re.compile(r"\+(\d+)\s*(?:days?)?", re.ASCII | re.IGNORECASE)
+_HM_TIME = re.compile(r"(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?", re.ASCII)
+
 
 def parse_datetime(date_str: str | None, time_str: str | None) -> datetime:
     """Parse date and time strings into a datetime object.
@@ -23,20 +43,36 @@ def parse_datetime(date_str: str | None, time_str: str | None) -> datetime:
     Supports various formats:
     - Date: "2024-02-07", "07/02/2024", "today", "tomorrow", "+2 days"
     - Time: "14:30", "2:30 PM", "14:30:00"
+
+    Common formats are matched with precompiled regexes; strptime is only
+    tried for anything else.
     """
-    if date_str is None:
+    if date_str is None and time_str is None:
+        return datetime.now()
+
+    target_date = None
+    if date_str in (None, "today", "Today"):
         target_date = datetime.now()
     elif date_str.lower() == "today":
         target_date = datetime.now()
     elif date_str.lower() == "tomorrow":
         target_date = datetime.now() + timedelta(days=1)
     elif date_str.startswith("+"):
-        # "+2 days" format
-        parts = date_str.split()
-        days = int(parts[0][1:])
-        target_date = datetime.now() + timedelta(days=days)
+        if not (m := _PLUS_DAYS.fullmatch(date_str)):
+            raise ValueError(
+                f"Unrecognized relative date '{date_str}' (expected e.g. '+2 days')"
+            )
+        target_date = datetime.now() + timedelta(days=int(m[1]))
     else:
-        # Try parsing as date
+        try:
+            if m := _ISO_DATE.fullmatch(date_str):
+                target_date = datetime(int(m[1]), int(m[2]), int(m[3]))
+            elif m := _EU_DATE.fullmatch(date_str):
+                target_date = datetime(int(m[4]), int(m[3]), int(m[1]))
+        except ValueError:
+            pass
+
+    if target_date is None:
         for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%d.%m.%Y"]:
             try:
                 target_date = datetime.strptime(date_str, fmt)
@@ -50,6 +86,11 @@ def parse_datetime(date_str: str | None, time_str: str | None) -> datetime:
         return target_date
 
     # Parse time
+    if m := _HM_TIME.fullmatch(time_str):
+        hour, minute = int(m[1]), int(m[2])
+        if hour < 24 and minute < 60 and (m[3] is None or int(m[3]) < 60):
+            return target_date.replace(hour=hour, minute=minute)
+
     for fmt in ["%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M:%S %p"]:
         try:
             time_obj = datetime.strptime(time_str, fmt)
@@ -60,9 +101,15 @@ def parse_datetime(date_str: str | None, time_str: str | None) -> datetime:
     return target_date
 
 
+def format_time(timestamp: int | str) -> str:
+    """Format a Unix timestamp as local HH:MM."""
+    t = time.localtime(int(timestamp))
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}"
+
+
 def format_departure(dep: dict) -> str:
     """Format a departure record for display."""
-    time_str = datetime.fromtimestamp(int(dep.get("time", 0))).strftime("%H:%M")
+    time_str = format_time(dep.get("time", 0))
     delay = int(dep.get("delay", 0)) // 60
     delay_str = f" (+{delay}min)" if delay else ""
     platform = dep.get("platform", "?")
@@ -84,8 +131,8 @@ def format_connection(conn: dict) -> str:
     """Format a connection record for display."""
     dep = conn.get("departure", {})
     arr = conn.get("arrival", {})
-    dept = datetime.fromtimestamp(int(dep.get("time", 0))).strftime("%H:%M")
-    arrv = datetime.fromtimestamp(int(arr.get("time", 0))).strftime("%H:%M")
+    dept = format_time(dep.get("time", 0))
+    arrv = format_time(arr.get("time", 0))
     duration = int(conn.get("duration", 0)) // 60  # convert to minutes
     transfers = int(conn.get("vias", {}).get("number", 0))
     transfer_str = f"{transfers} transfer(s)" if transfers else "Direct"
@@ -100,6 +147,22 @@ def format_connection(conn: dict) -> str:
     )
 
 
+def format_stop(stop: dict) -> str:
+    """Format a vehicle stop record for display."""
+    station_name = stop.get("stationinfo", {}).get("name", stop.get("station", "Unknown"))
+    scheduled_dep = stop.get("scheduledDepartureTime", stop.get("time", "0"))
+    scheduled_arr = stop.get("scheduledArrivalTime", stop.get("time", "0"))
+    delay = int(stop.get("departureDelay", stop.get("arrivalDelay", "0"))) // 60
+    delay_str = f" (+{delay}min)" if delay else ""
+    canceled = " [CANCELED]" if stop.get("departureCanceled") == "1" or stop.get("arrivalCanceled") == "1" else ""
+    platform = stop.get("platform", "?")
+
+    arr_time = format_time(scheduled_arr) if scheduled_arr != "0" else "--:--"
+    dep_time = format_time(scheduled_dep) if scheduled_dep != "0" else "--:--"
+
+    return f"{station_name}: {arr_time}→{dep_time}{delay_str} (Pl. {platform}){canceled}"
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
@@ -155,6 +218,40 @@ async def list_tools() -> list[Tool]:
                 "required": ["station"],
             },
         ),
+        Tool(
+            name="get_multi_liveboard",
+            description="Get real-time departures or arrivals for several stations at once",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "stations": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": MAX_MULTI_STATIONS,
+                        "description": "Station names or URIs (e.g., ['Brussels Central', 'Antwerpen-Centraal'])",
+                    },
+                    "date": {
+                        "type": "string",
+                        "description": "Date in format YYYY-MM-DD or relative (today, tomorrow, +2 days)",
+                    },
+                    "time": {
+                        "type": "string",
+                        "description": "Time in 24-hour format (e.g., '14:30')",
+                    },
+                    "arrival": {
+                        "type": "boolean",
+                        "description": "If true, show arrivals; if false, show departures (default: false)",
+                        "default": False,
+                    },
+                    "lang": {
+                        "type": "string",
+                        "description": "Language code (en, nl, fr, de, it)",
+                        "default": "en",
+                    },
+                },
+                "required": ["stations"],
+            },
+        ),
         Tool(
             name="find_connections",
             description="Find routes between two stations with connection details",
@@ -239,23 +336,33 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             result = _search_stations(arguments)
             return [TextContent(type="text", text=result)]
 
-        async with iRailClient() as client:
-            if name == "get_liveboard":
-                result = await _get_liveboard(client, arguments)
-            elif name == "find_connections":
-                result = await _find_connections(client, arguments)
-            elif name == "get_train_info":
-                result = await _get_train_info(client, arguments)
-            elif name == "get_disturbances":
-                result = await _get_disturbances(client, arguments)
-            else:
-                result = f"Unknown tool: {name}"
+        if _client is not None:
+            result = await _dispatch(_client, name, arguments)
+        else:
+            async with iRailClient() as client:
+                result = await _dispatch(client, name, arguments)
 
         return [TextContent(type="text", text=result)]
     except Exception as e:
-        error_msg = f"Error: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return [TextContent(type="text", text=error_msg)]
+        # Handlers already turn expected API errors into messages, so anything
+        # reaching this point is unexpected and worth a traceback.
+        logger.exception("Unexpected error in %s", name)
+        return [TextContent(type="text", text=f"Error: {e}")]
+
+
+async def _dispatch(client: iRailClient, name: str, arguments: dict) -> str:
+    """Route an API-backed tool call to its handler."""
+    if name == "get_liveboard":
+        return await _get_liveboard(client, arguments)
+    elif name == "get_multi_liveboard":
+        return await _get_multi_liveboard(client, arguments)
+    elif name == "find_connections":
+        return await _find_connections(client, arguments)
+    elif name == "get_train_info":
+        return await _get_train_info(client, arguments)
+    elif name == "get_disturbances":
+        return await _get_disturbances(client, arguments)
+    return f"Unknown tool: {name}"
 
 
 def _search_stations(arguments: dict) -> str:
@@ -324,8 +431,7 @@ async def _get_liveboard(client: iRailClient, arguments: dict) -> str:
     if not departures:
         lines.append(f"No {board_type.lower()} found.")
     else:
-        for dep in departures[:15]:  # Limit to 15
-            lines.append(f"  {format_departure(dep)}")
+        lines.extend(f"  {format_departure(dep)}" for dep in departures[:15])  # Limit to 15
 
         if len(departures) > 15:
             lines.append(f"\n  ... and {len(departures) - 15} more")
@@ -333,6 +439,32 @@ async def _get_liveboard(client: iRailClient, arguments: dict) -> str:
     return "\n".join(lines)
 
 
+async def _get_multi_liveboard(client: iRailClient, arguments: dict) -> str:
+    """Get liveboards for several stations concurrently."""
+    stations = arguments.get("stations")
+
+    if not stations:
+        return "Error: 'stations' parameter is required"
+    if not isinstance(stations, list) or not all(
+        isinstance(station, str) and station for station in stations
+    ):
+        return "Error: 'stations' must be a list of station names"
+    if len(stations) > MAX_MULTI_STATIONS:
+        return f"Error: at most {MAX_MULTI_STATIONS} stations can be requested at once"
+
+    async def board(station: str) -> str:
+        # Network failures only cost this station's board, not the batch
+        try:
+            return await _get_liveboard(client, {**arguments, "station": station})
+        except httpx.HTTPError as e:
+            return f"Error fetching liveboard for {station}: {str(e) or type(e).__name__}"
+
+    # Requests overlap on the network; the client's rate limiter still
+    # spaces them out.
+    boards = await asyncio.gather(*(board(station) for station in stations))
+    return "\n\n".join(boards)
+
+
 async def _find_connections(client: iRailClient, arguments: dict) -> str:
     """Find connections between stations."""
     from_station = arguments.get("from_station", "")
@@ -368,8 +500,9 @@ async def _find_connections(client: iRailClient, arguments: dict) -> str:
     if not connections:
         lines.append("No connections found.")
     else:
-        for conn in connections[:10]:  # Limit to 10 connections
-            lines.append(f"  {format_connection(conn)}")
+        lines.extend(
+            f"  {format_connection(conn)}" for conn in connections[:10]  # Limit to 10 connections
+        )
 
         if len(connections) > 10:
             lines.append(f"\n  ... and {len(connections) - 10} more")
@@ -405,23 +538,7 @@ async def _get_train_info(client: iRailClient, arguments: dict) -> str:
 
     if stops:
         lines.append(f"\n  Stops ({len(stops)} total):")
-        for stop in stops[:20]:  # Limit to 20 stops
-            station_name = stop.get("stationinfo", {}).get("name", stop.get("station", "Unknown"))
-            scheduled_dep = stop.get("scheduledDepartureTime", stop.get("time", "0"))
-            scheduled_arr = stop.get("scheduledArrivalTime", stop.get("time", "0"))
-            delay = int(stop.get("departureDelay", stop.get("arrivalDelay", "0"))) // 60
-            delay_str = f" (+{delay}min)" if delay else ""
-            canceled = " [CANCELED]" if stop.get("departureCanceled") == "1" or stop.get("arrivalCanceled") == "1" else ""
-            platform = stop.get("platform", "?")
-
-            arr_time = datetime.fromtimestamp(
-                int(scheduled_arr)
-            ).strftime("%H:%M") if scheduled_arr != "0" else "--:--"
-            dep_time = datetime.fromtimestamp(
-                int(scheduled_dep)
-            ).strftime("%H:%M") if scheduled_dep != "0" else "--:--"
-
-            lines.append(f"    • {station_name}: {arr_time}→{dep_time}{delay_str} (Pl. {platform}){canceled}")
+        lines.extend(f"    • {format_stop(stop)}" for stop in stops[:20])  # Limit to 20 stops
 
         if len(stops) > 20:
             lines.append(f"    ... and {len(stops) - 20} more")
@@ -480,14 +597,19 @@ async def main():
 
     logging.basicConfig(level=logging.INFO)
 
-    async with stdio_server() as (read_stream, write_stream):
-        init_options = app.create_initialization_options()
-        await app.run(read_stream, write_stream, init_options)
+    global _client
+
+    async with iRailClient() as client, stdio_server() as (read_stream, write_stream):
+        _client = client
+        try:
+            init_options = app.create_initialization_options()
+            await app.run(read_stream, write_stream, init_options)
+        finally:
+            _client = None
 
 
 def cli():
     """Entry point for console script."""
-    import asyncio
     asyncio.run(main())
 
 
@@ -4,34 +4,66 @@ Loads stations.json once at import time, then searches with accent-folded,
 case-insensitive substring matching across all name variants.
 """
 
-import json
 import unicodedata
+from bisect import bisect_right
 from functools import lru_cache
 from importlib import resources
+from itertools import accumulate
+
+import orjson
+
+# Combining diacritical mark blocks, mapped to None for str.translate
+_COMBINING_RANGES = (
+    (0x0300, 0x0370),  # Combining Diacritical Marks
+    (0x0483, 0x048A),  # Cyrillic combining marks
+    (0x1AB0, 0x1B00),  # Combining Diacritical Marks Extended
+    (0x1DC0, 0x1E00),  # Combining Diacritical Marks Supplement
+    (0x20D0, 0x2100),  # Combining Diacritical Marks for Symbols
+    (0xFE20, 0xFE30),  # Combining Half Marks
+)
+_COMBINING_TABLE = {
+    cp: None
+    for start, end in _COMBINING_RANGES
+    for cp in range(start, end)
+    if unicodedata.combining(chr(cp))
+}
 
 
 def _strip_accents(text: str) -> str:
     """Remove accents/diacritics from text via NFKD decomposition."""
-    nfkd = unicodedata.normalize("NFKD", text)
-    return "".join(c for c in nfkd if not unicodedata.combining(c))
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).translate(_COMBINING_TABLE)
 
 
 def _normalize(text: str) -> str:
     """Normalize text for search: strip accents and casefold."""
+    if text.isascii():
+        # casefold() and lower() agree on ASCII
+        return text.lower()
     return _strip_accents(text).casefold()
 
 
-@lru_cache(maxsize=1)
-def _load_stations() -> list[dict]:
+# Memoized for search queries, which clients tend to repeat; station names
+# are normalized once at load and would only crowd the cache.
+_normalize_query = lru_cache(maxsize=512)(_normalize)
+
+# Separates stations in the packed search corpus; never produced by _normalize
+_SEPARATOR = "\x01"
+
+
+def _build_stations() -> tuple[list[dict], str, list[int]]:
     """Load and pre-process station data from bundled JSON.
 
-    Each station gets a '_search_text' field: all name variants joined and
-    normalized for fast substring matching.
+    Returns the station dicts, a search corpus holding every station's name
+    variants normalized and joined, one station per _SEPARATOR-delimited
+    segment, and the start offset of each station's segment in the corpus.
     """
     data_files = resources.files("irail_mcp.data")
     stations_file = data_files.joinpath("stations.json")
-    raw = json.loads(stations_file.read_text(encoding="utf-8"))
+    raw = orjson.loads(stations_file.read_bytes())
 
+    texts = []
     for station in raw:
         names = [
             station.get("name", ""),
@@ -40,9 +72,42 @@ def _load_stations() -> list[dict]:
             station.get("alternative_de", ""),
             station.get("alternative_en", ""),
         ]
-        station["_search_text"] = _normalize(" ".join(n for n in names if n))
+        texts.append(_normalize(" ".join(n for n in names if n)))
+
+    starts = list(accumulate((len(t) + 1 for t in texts[:-1]), initial=0))
+    return raw, _SEPARATOR.join(texts), starts
 
-    return raw
+
+_STATIONS, _CORPUS, _STARTS = _build_stations()
+# Every character that occurs in any station's search text
+_ALPHABET = frozenset(_CORPUS)
+
+
+@lru_cache(maxsize=256)
+def _search_normalized(normalized_query: str) -> tuple[dict, ...]:
+    """Find stations whose search text contains an already-normalized query.
+
+    Cached on the normalized form, so "Liege", "liege" and "LIÈGE" share an
+    entry.
+    """
+    # A character no station contains cannot match; skip the scan
+    if _SEPARATOR in normalized_query or not _ALPHABET.issuperset(normalized_query):
+        return ()
+
+    # Scan the whole corpus with str.find and map each hit back to its
+    # station, then resume at the next station's segment so each station
+    # is found at most once.
+    results = []
+    last = len(_STARTS) - 1
+    pos = _CORPUS.find(normalized_query)
+    while pos != -1:
+        index = bisect_right(_STARTS, pos) - 1
+        results.append(_STATIONS[index])
+        if index == last:
+            break
+        pos = _CORPUS.find(normalized_query, _STARTS[index + 1])
+
+    return tuple(results)
 
 
 def search_stations(query: str) -> list[dict]:
@@ -55,17 +120,8 @@ def search_stations(query: str) -> list[dict]:
         List of matching station dicts with keys: uri, name,
         alternative_fr/nl/de/en, longitude, latitude, country_code.
     """
-    if not query or not query.strip():
+    if not query or not (stripped := query.strip()):
         return []
 
-    normalized_query = _normalize(query.strip())
-    stations = _load_stations()
-
-    results = []
-    for station in stations:
-        if normalized_query in station["_search_text"]:
-            # Return a copy without the internal _search_text field
-            result = {k: v for k, v in station.items() if k != "_search_text"}
-            results.append(result)
-
-    return results
+    # Copy so callers cannot modify the cached station data
+    return [station.copy() for station in _search_normalized(_normalize_query(stripped))]
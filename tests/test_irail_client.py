@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime, timedelta
 
-from irail_mcp.irail_client import iRailClient, RateLimiter
+from irail_mcp.irail_client import iRailClient, RateLimiter, _format_datetime
 
 
 @pytest.mark.asyncio
@@ -12,15 +12,30 @@ async def test_rate_limiter():
     limiter = RateLimiter(10)  # 10 requests per second
 
     import time
-    start = time.time()
+    start = time.monotonic()
 
-    # Make 5 requests with rate limiting
-    for _ in range(5):
+    # Make 15 requests: the first 10 use the burst capacity
+    for _ in range(15):
         await limiter.wait()
 
-    elapsed = time.time() - start
-    # Should take at least 0.4 seconds (4 intervals of 0.1s)
-    assert elapsed >= 0.35
+    elapsed = time.monotonic() - start
+    # Should take at least 0.5 seconds (5 refills of 0.1s)
+    assert elapsed >= 0.45
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst():
+    """Test rate limiter lets a burst up to capacity through immediately."""
+    limiter = RateLimiter(3)
+
+    import time
+    start = time.monotonic()
+
+    for _ in range(3):
+        await limiter.wait()
+
+    elapsed = time.monotonic() - start
+    assert elapsed < 0.1
 
 
 @pytest.mark.asyncio
@@ -30,6 +45,71 @@ async def test_client_initialization():
         assert client.client is not None
 
 
+@pytest.mark.asyncio
+async def test_disturbances_and_vehicle_are_cached():
+    """Repeat disturbance/vehicle lookups within the TTL reuse the response."""
+    calls = []
+
+    async def fake_request(method, path, **kwargs):
+        calls.append((path, kwargs["params"].get("lang")))
+        return {"path": path}
+
+    client = iRailClient()
+    client._request = fake_request
+
+    await client.get_disturbances(lang="en")
+    await client.get_disturbances(lang="en")
+    await client.get_disturbances(lang="nl")
+    assert calls == [("/disturbances/", "en"), ("/disturbances/", "nl")]
+
+    dt = datetime(2024, 2, 7)
+    await client.get_vehicle("IC1832", dt)
+    await client.get_vehicle("IC1832", dt)
+    await client.get_vehicle("IC1832", dt + timedelta(days=1))
+    assert calls.count(("/vehicle/", "en")) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_expire():
+    """Cached responses are refetched once the TTL has passed."""
+    calls = []
+
+    async def fake_request(method, path, **kwargs):
+        calls.append(path)
+        return {}
+
+    client = iRailClient()
+    client._request = fake_request
+
+    await client.get_disturbances()
+    key = next(iter(client._cache))
+    client._cache[key] = (0.0, client._cache[key][1])
+    await client.get_disturbances()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, message",
+    [
+        (404, "Station or resource not found."),
+        (429, "Rate limit exceeded"),
+        (503, "iRail API server error (503)"),
+    ],
+)
+async def test_http_errors_become_value_errors(status, message):
+    """HTTP error statuses are mapped to user-facing ValueErrors."""
+    import re
+    import httpx
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(status))
+    client = iRailClient()
+    async with httpx.AsyncClient(transport=transport) as client.client:
+        with pytest.raises(ValueError, match=re.escape(message)) as exc_info:
+            await client.get_liveboard("Gent-Sint-Pieters")
+    assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
+
+
 @pytest.mark.asyncio
 async def test_datetime_formatting():
     """Test datetime string formatting for API calls."""
@@ -61,6 +141,13 @@ async def test_datetime_formatting():
     assert dt.day == future.day
 
 
+def test_format_datetime_params():
+    """Test iRail date/time query parameter formatting."""
+    dt = datetime(2024, 2, 7, 9, 5)
+    assert _format_datetime(dt) == (dt.strftime("%d%m%y"), dt.strftime("%H%M"))
+    assert _format_datetime(dt) == ("070224", "0905")
+
+
 def test_format_departure():
     """Test departure formatting with realistic iRail API data."""
     from irail_mcp.server import format_departure
@@ -2,15 +2,18 @@
 
 import pytest
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from irail_mcp.server import (
     app,
     parse_datetime,
+    format_time,
     format_departure,
     format_connection,
+    format_stop,
     _search_stations,
     _get_liveboard,
+    _get_multi_liveboard,
     _find_connections,
     _get_train_info,
     _get_disturbances,
@@ -57,6 +60,54 @@ class TestDateParsing:
         assert dt.month == 2
         assert dt.day == 7
 
+    def test_parse_dotted_date_with_seconds(self):
+        """Parse dd.mm.yyyy date and HH:MM:SS time."""
+        dt = parse_datetime("07.02.2024", "09:05:30")
+        assert (dt.year, dt.month, dt.day) == (2024, 2, 7)
+        assert (dt.hour, dt.minute) == (9, 5)
+
+    def test_parse_invalid_date_falls_back_to_today(self):
+        """An impossible date falls back to today."""
+        dt = parse_datetime("2024-02-30", "12:00")
+        assert dt.date() == datetime.now().date()
+        assert dt.hour == 12
+
+    def test_parse_single_digit_minutes(self):
+        """Single-digit minutes are accepted, as with strptime("%H:%M")."""
+        dt = parse_datetime("2024-02-07", "9:5")
+        assert (dt.hour, dt.minute) == (9, 5)
+
+    def test_parse_relative_days_without_space(self):
+        """"+2days" is read as two days ahead."""
+        dt = parse_datetime("+2days", "12:00")
+        expected = datetime.now() + timedelta(days=2)
+        assert dt.date() == expected.date()
+
+    @pytest.mark.parametrize("date_str", ["+2 weeks", "+x", "+"])
+    def test_parse_unrecognized_relative_date_raises(self, date_str):
+        """Unknown "+..." forms are rejected rather than silently meaning today."""
+        with pytest.raises(ValueError):
+            parse_datetime(date_str, "12:00")
+
+    def test_parse_date_with_trailing_newline_falls_back_to_today(self):
+        """A trailing newline is not accepted, matching strptime."""
+        dt = parse_datetime("2024-02-07\n", None)
+        assert dt.date() == datetime.now().date()
+
+    def test_parse_non_ascii_digits_match_strptime(self):
+        """Non-ASCII digits bypass the regex fast path and behave as strptime does."""
+        date_str = "\u0662\u0660\u0662\u0664-\u0660\u0662-\u0660\u0667"
+        try:
+            expected = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            expected = datetime.now().date()
+        assert parse_datetime(date_str, None).date() == expected
+
+    def test_parse_time_with_invalid_seconds_is_ignored(self):
+        """HH:MM:SS with out-of-range seconds is rejected, as with strptime."""
+        dt = parse_datetime("2024-02-07", "14:30:61")
+        assert (dt.hour, dt.minute) == (0, 0)
+
     def test_parse_12hour_time_format(self):
         """Parse 12-hour time format."""
         dt = parse_datetime("2024-02-07", "2:30 PM")
@@ -67,6 +118,12 @@ class TestDateParsing:
 class TestFormatting:
     """Test output formatting functions with realistic iRail API data structures."""
 
+    def test_format_time_matches_local_strftime(self):
+        """format_time renders local HH:MM like datetime.strftime."""
+        ts = int(datetime(2024, 2, 7, 9, 5).timestamp())
+        assert format_time(ts) == "09:05"
+        assert format_time(str(ts)) == datetime.fromtimestamp(ts).strftime("%H:%M")
+
     def test_format_departure_with_delay(self):
         """Format departure with delay. API returns all values as strings."""
         now = str(int(datetime.now().timestamp()))
@@ -233,6 +290,98 @@ class TestFormatting:
         assert "Direct" in result
         assert "30min" in result
 
+    def test_format_stop(self):
+        """Format a vehicle stop with delay and cancellation flags as strings."""
+        now = int(datetime.now().timestamp())
+        stop = {
+            "station": "Gent-Sint-Pieters",
+            "stationinfo": {"name": "Gent-Sint-Pieters"},
+            "scheduledArrivalTime": str(now),
+            "scheduledDepartureTime": str(now + 120),
+            "departureDelay": "180",
+            "arrivalDelay": "0",
+            "platform": "4",
+            "departureCanceled": "1",
+        }
+        result = format_stop(stop)
+        assert result.startswith("Gent-Sint-Pieters: ")
+        assert "(+3min)" in result
+        assert "(Pl. 4)" in result
+        assert "[CANCELED]" in result
+
+
+class TestMultiLiveboard:
+    """Test the batch liveboard handler."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_every_station(self):
+        """Each station gets its own liveboard section, in request order."""
+        requested = []
+
+        class FakeClient:
+            async def get_liveboard(self, station, dt, arrival=False, lang="en"):
+                requested.append(station)
+                return {"stationinfo": {"name": station}, "departures": {"departure": []}}
+
+        result = await _get_multi_liveboard(
+            FakeClient(), {"stations": ["Gent-Sint-Pieters", "Leuven"]}
+        )
+        assert sorted(requested) == ["Gent-Sint-Pieters", "Leuven"]
+        assert result.index("Departures at Gent-Sint-Pieters") < result.index("Departures at Leuven")
+
+    @pytest.mark.asyncio
+    async def test_one_station_failing_keeps_the_others(self):
+        """A network error on one station only replaces that station's board."""
+        import httpx
+
+        class FakeClient:
+            async def get_liveboard(self, station, dt, arrival=False, lang="en"):
+                if station == "Leuven":
+                    raise httpx.ConnectTimeout("")
+                return {"stationinfo": {"name": station}, "departures": {"departure": []}}
+
+        result = await _get_multi_liveboard(
+            FakeClient(), {"stations": ["Gent-Sint-Pieters", "Leuven", "Mechelen"]}
+        )
+        assert "Departures at Gent-Sint-Pieters" in result
+        assert "Error fetching liveboard for Leuven: ConnectTimeout" in result
+        assert "Departures at Mechelen" in result
+
+    @pytest.mark.asyncio
+    async def test_rejects_string_instead_of_list(self):
+        """A bare string is not iterated character by character."""
+        calls = []
+
+        class FakeClient:
+            async def get_liveboard(self, station, dt, arrival=False, lang="en"):
+                calls.append(station)
+                return {}
+
+        result = await _get_multi_liveboard(FakeClient(), {"stations": "Gent"})
+        assert result.startswith("Error:")
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_string_items(self):
+        """Every station entry must be a non-empty string."""
+        result = await _get_multi_liveboard(None, {"stations": ["Gent", 42]})
+        assert result.startswith("Error:")
+
+    @pytest.mark.asyncio
+    async def test_caps_station_count(self):
+        """Requests above MAX_MULTI_STATIONS are rejected before any API call."""
+        from irail_mcp.server import MAX_MULTI_STATIONS
+
+        stations = [f"Station {i}" for i in range(MAX_MULTI_STATIONS + 1)]
+        result = await _get_multi_liveboard(None, {"stations": stations})
+        assert result.startswith("Error:")
+
+    @pytest.mark.asyncio
+    async def test_requires_stations(self):
+        """An empty station list is rejected."""
+        result = await _get_multi_liveboard(None, {"stations": []})
+        assert result.startswith("Error:")
+
 
 class TestClientInitialization:
     """Test iRailClient initialization."""
@@ -255,6 +404,80 @@ class TestClientInitialization:
         assert limiter.delay == pytest.approx(1.0 / 3, abs=0.001)
 
 
+class TestSharedClient:
+    """Test that tool calls reuse the client opened by main()."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_uses_shared_client(self, monkeypatch):
+        """call_tool dispatches through server._client without opening a new one."""
+        from irail_mcp import server
+
+        class FakeClient:
+            async def get_disturbances(self, lang="en"):
+                return {"disturbance": [{"title": "Works near Gent"}]}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("call_tool constructed a new iRailClient")
+
+        monkeypatch.setattr(server, "iRailClient", fail)
+        monkeypatch.setattr(server, "_client", FakeClient())
+
+        result = await server.call_tool("get_disturbances", {})
+        assert "Works near Gent" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_main_resets_shared_client(self, monkeypatch):
+        """main() clears server._client once the server stops, even on error."""
+        import contextlib
+        import mcp.server.stdio
+        from irail_mcp import server
+
+        class FakeClient:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+        @contextlib.asynccontextmanager
+        async def fake_stdio_server():
+            yield None, None
+
+        seen = []
+
+        async def fake_run(*args, **kwargs):
+            seen.append(server._client)
+            raise RuntimeError("stop")
+
+        monkeypatch.setattr(server, "iRailClient", FakeClient)
+        monkeypatch.setattr(mcp.server.stdio, "stdio_server", fake_stdio_server)
+        monkeypatch.setattr(server.app, "run", fake_run)
+
+        with pytest.raises(RuntimeError, match="stop"):
+            await server.main()
+
+        assert isinstance(seen[0], FakeClient)
+        assert server._client is None
+
+
+    @pytest.mark.asyncio
+    async def test_call_tool_logs_traceback_for_handler_bugs(self, monkeypatch, caplog):
+        """A ValueError escaping a handler is logged with its traceback."""
+        from irail_mcp import server
+
+        class FakeClient:
+            async def get_liveboard(self, station, dt, arrival=False, lang="en"):
+                return {"departures": {"departure": [{"time": "n/a"}]}}
+
+        monkeypatch.setattr(server, "_client", FakeClient())
+
+        with caplog.at_level("ERROR", logger="irail_mcp.server"):
+            result = await server.call_tool("get_liveboard", {"station": "Gent"})
+
+        assert result[0].text.startswith("Error:")
+        assert caplog.records and caplog.records[0].exc_info is not None
+
+
 class TestMCPServerRegistration:
     """Test that MCP server tools are registered."""
 
@@ -2,7 +2,13 @@
 
 import pytest
 
-from irail_mcp.station_search import search_stations, _normalize, _strip_accents
+from irail_mcp import station_search
+from irail_mcp.station_search import (
+    search_stations,
+    _normalize,
+    _search_normalized,
+    _strip_accents,
+)
 
 
 class TestNormalization:
@@ -23,6 +29,13 @@ class TestNormalization:
     def test_normalize_preserves_hyphens(self):
         assert _normalize("Gent-Sint-Pieters") == "gent-sint-pieters"
 
+    def test_normalize_ascii_matches_casefold(self):
+        text = "'s Hertogenbosch ANTWERPEN-Centraal"
+        assert _normalize(text) == text.casefold()
+
+    def test_normalize_non_ascii_casefolds(self):
+        assert _normalize("STRAßE Liège") == "strasse liege"
+
 
 class TestStationSearch:
     """Test station search functionality."""
@@ -92,3 +105,75 @@ class TestStationSearch:
         """Sanity check: searching a very common letter returns many results."""
         results = search_stations("a")
         assert len(results) > 50
+
+    def test_search_cached_on_normalized_query(self):
+        """Spelling variants of one query share a cache entry."""
+        _search_normalized.cache_clear()
+        first = search_stations("Liege")
+        second = search_stations("  LIÈGE ")
+        assert first == second
+        assert _search_normalized.cache_info().hits == 1
+
+    def test_search_returns_fresh_list(self):
+        """Mutating a returned list does not affect later results."""
+        results = search_stations("Gent")
+        results.clear()
+        assert search_stations("Gent")
+
+    def test_results_are_plain_dicts(self):
+        """Results are JSON-serializable dicts that callers may modify freely."""
+        import json
+
+        results = search_stations("Aalst")
+        assert all(type(station) is dict for station in results)
+        json.dumps(results)
+
+        results[0]["name"] = "Changed"
+        assert search_stations("Aalst")[0]["name"] != "Changed"
+
+
+@pytest.fixture
+def small_corpus(monkeypatch):
+    """Replace the bundled index with three hand-made stations."""
+    stations = [{"name": "Gent Gent"}, {"name": "Ab"}, {"name": "Cd"}]
+    texts = ["gent gent", "ab", "cd"]
+    corpus = station_search._SEPARATOR.join(texts)
+    monkeypatch.setattr(station_search, "_STATIONS", stations)
+    monkeypatch.setattr(station_search, "_CORPUS", corpus)
+    monkeypatch.setattr(station_search, "_STARTS", [0, 10, 13])
+    monkeypatch.setattr(station_search, "_ALPHABET", frozenset(corpus))
+    _search_normalized.cache_clear()
+    yield stations
+    _search_normalized.cache_clear()
+
+
+class TestCorpusScan:
+    """Test the packed-corpus scan behind search_stations."""
+
+    def test_repeated_match_in_one_station_returns_it_once(self, small_corpus):
+        assert search_stations("gent") == [small_corpus[0]]
+
+    def test_last_station_is_found(self, small_corpus):
+        assert search_stations("cd") == [small_corpus[2]]
+
+    def test_no_match_across_station_boundary(self, small_corpus):
+        # "ab" and "cd" are adjacent in the corpus, but only via the separator
+        assert search_stations("bc") == []
+
+    def test_matches_every_station_in_order(self, small_corpus):
+        assert search_stations("t") == [small_corpus[0]]
+        assert search_stations("b") == [small_corpus[1]]
+
+    def test_query_with_unknown_character_returns_empty(self):
+        """A character that occurs in no station name short-circuits to no results."""
+        assert "7" not in station_search._ALPHABET
+        assert search_stations("Gent7") == []
+
+    def test_query_with_separator_returns_empty(self):
+        """The corpus separator can never be part of a match."""
+        assert search_stations("Gent\x01Aalst") == []
+        assert search_stations("\x01") == []
+
+    def test_bundled_last_station_is_found(self):
+        last = station_search._STATIONS[-1]
+        assert last in search_stations(last["name"])
@@ -0,0 +1,65 @@
+"""Tests for the station data update script."""
+
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "update_stations.py"
+_spec = importlib.util.spec_from_file_location("update_stations", SCRIPT_PATH)
+update_stations = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(update_stations)
+
+HEADER = (
+    "URI,name,alternative-fr,alternative-nl,alternative-de,alternative-en,"
+    "longitude,latitude,country-code,avg_stop_times\n"
+)
+
+
+class TestParseStations:
+    """Test CSV parsing into station dicts."""
+
+    def test_parses_quoted_short_and_blank_rows(self):
+        csv_text = (
+            HEADER
+            + 'http://irail.be/stations/NMBS/008814001,"Brussel-Zuid, Midi",'
+            '"Bruxelles-Midi",,,"Brussels-South, Midi",4.336531,50.835707,be,2.5\n'
+            "\n"
+            "http://irail.be/stations/NMBS/008892007,Gent-Sint-Pieters\n"
+            "http://irail.be/stations/NMBS/000000000,,,,,,1.0,2.0,be,0\n"
+        )
+
+        stations = update_stations.parse_stations(io.StringIO(csv_text))
+
+        assert stations == [
+            {
+                "uri": "http://irail.be/stations/NMBS/008814001",
+                "name": "Brussel-Zuid, Midi",
+                "alternative_fr": "Bruxelles-Midi",
+                "alternative_nl": "",
+                "alternative_de": "",
+                "alternative_en": "Brussels-South, Midi",
+                "longitude": "4.336531",
+                "latitude": "50.835707",
+                "country_code": "be",
+            },
+            {
+                "uri": "http://irail.be/stations/NMBS/008892007",
+                "name": "Gent-Sint-Pieters",
+                "alternative_fr": "",
+                "alternative_nl": "",
+                "alternative_de": "",
+                "alternative_en": "",
+                "longitude": "",
+                "latitude": "",
+                "country_code": "",
+            },
+        ]
+
+    def test_missing_column_raises(self):
+        with pytest.raises(ValueError, match="latitude"):
+            update_stations.parse_stations(
+                io.StringIO("URI,name,alternative-fr,alternative-nl,"
+                            "alternative-de,alternative-en,longitude,country-code\n")
+            )